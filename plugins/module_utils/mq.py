@@ -0,0 +1,86 @@
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Helpers shared by the Amazon MQ modules."""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import functools
+
+try:
+    import botocore
+except ImportError:
+    pass  # handled by AnsibleAWSModule
+
+from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
+
+
+_CLIENT_CACHE = {}
+
+# default botocore client settings for the mq modules; values the user sets
+# through the standard aws_config option take precedence
+_MQ_CONFIG_DEFAULTS = {
+    # the list/describe/update calls of one invocation reuse pooled connections
+    'max_pool_connections': 20,
+}
+
+# name -> id mapping of all brokers, populated at most once per process and
+# refreshed on a lookup miss
+_BROKER_NAME_TO_ID = {}
+
+
+def api_call(error_msg):
+    """Wrap a thin boto3 call with the standard ClientError/BotoCoreError handling."""
+    def wrapper(fn):
+        @functools.wraps(fn)
+        def handler(conn, module, *args, **kwargs):
+            try:
+                return fn(conn, module, *args, **kwargs)
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                module.fail_json_aws(e, msg=error_msg)
+        return handler
+    return wrapper
+
+
+def get_mq_client(module):
+    """Return the mq client for this process, creating it on first use.
+
+    Modules normally run in a process of their own, but when several
+    invocations share one interpreter (unit tests, ansible-test units)
+    reusing the client avoids re-parsing the botocore service model and
+    re-establishing the TLS context every time.
+    """
+    cache_key = (
+        module.params.get('region'),
+        module.params.get('profile'),
+        module.params.get('aws_access_key'),
+    )
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is None:
+        aws_config = dict(_MQ_CONFIG_DEFAULTS)
+        aws_config.update(module.params.get('aws_config') or {})
+        module.params['aws_config'] = aws_config
+        client = module.client('mq', retry_decorator=AWSRetry.jittered_backoff(retries=8))
+        _CLIENT_CACHE[cache_key] = client
+    return client
+
+
+def _populate_broker_index(conn):
+    _BROKER_NAME_TO_ID.clear()
+    paginator = conn.get_paginator('list_brokers')
+    for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+        _BROKER_NAME_TO_ID.update({broker['BrokerName']: broker['BrokerId'] for broker in page['BrokerSummaries']})
+
+
+@api_call("Couldn't list brokers.")
+def get_broker_id(conn, module):
+    broker_name = module.params['broker_name']
+    if broker_name not in _BROKER_NAME_TO_ID:
+        _populate_broker_index(conn)
+    return _BROKER_NAME_TO_ID.get(broker_name)
+
+
+@api_call("Couldn't get broker details.")
+def get_broker_info(conn, module, broker_id):
+    return conn.describe_broker(BrokerId=broker_id, aws_retry=True)
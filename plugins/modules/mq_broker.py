@@ -0,0 +1,505 @@
+#!/usr/bin/python
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: mq_broker
+version_added: 1.4.0
+short_description: Manage Amazon MQ brokers
+description:
+  - Create, update, delete or reboot an Amazon MQ broker.
+  - Does not wait for the broker to reach its target state unless I(wait=true);
+    with I(wait=false) a broker operation only gets queued and the module returns
+    immediately with the API response.
+requirements: [ boto3 ]
+author: "FCO (@fotto)"
+options:
+  broker_name:
+    description:
+      - The name of the broker. Used to identify the broker for all states.
+    required: true
+    type: str
+  state:
+    description:
+      - C(present) creates or updates the broker.
+      - C(absent) deletes the broker.
+      - C(restarted) reboots the broker.
+    default: present
+    choices: [ 'present', 'absent', 'restarted' ]
+    type: str
+  deployment_mode:
+    description:
+      - The broker's deployment mode. Can only be set on creation.
+    choices: [ 'SINGLE_INSTANCE', 'ACTIVE_STANDBY_MULTI_AZ', 'CLUSTER_MULTI_AZ' ]
+    type: str
+  use_aws_owned_key:
+    description:
+      - Whether to use an AWS owned key for broker encryption. Can only be set on creation.
+    type: bool
+  kms_key_id:
+    description:
+      - Use referenced KMS key for broker encryption. Only applicable if I(use_aws_owned_key=false).
+      - Can only be set on creation.
+    type: str
+  engine_type:
+    description:
+      - The broker's engine type. Can only be set on creation.
+    choices: [ 'ACTIVEMQ', 'RABBITMQ' ]
+    type: str
+  maintenance_window_start_time:
+    description:
+      - The scheduled time period (UTC) during which maintenance can be applied, as a dict
+        with keys C(DayOfWeek), C(TimeOfDay) and C(TimeZone).
+      - Can only be set on creation.
+    type: dict
+  publicly_accessible:
+    description:
+      - Whether to allow public network access to the broker. Can only be set on creation.
+    type: bool
+  storage_type:
+    description:
+      - The broker's storage type. Can only be set on creation.
+    choices: [ 'EBS', 'EFS' ]
+    type: str
+  subnet_ids:
+    description:
+      - The list of subnet IDs in which to launch the broker. Can only be set on creation.
+    type: list
+    elements: str
+  users:
+    description:
+      - The list of initial broker users, each a dict with keys C(Username), C(Password),
+        C(ConsoleAccess) and C(Groups). Can only be set on creation.
+      - If unset a single user C(admin) with a default password is created on creation.
+    type: list
+    elements: dict
+  tags:
+    description:
+      - Tags to attach to the broker. Can only be set on creation.
+    type: dict
+  authentication_strategy:
+    description:
+      - The authentication strategy used by the broker. C(LDAP) is currently not supported.
+    choices: [ 'SIMPLE', 'LDAP' ]
+    type: str
+  auto_minor_version_upgrade:
+    description:
+      - Whether to automatically upgrade to new minor engine versions.
+    default: true
+    type: bool
+  engine_version:
+    description:
+      - The broker engine version, e.g. C(5.15.13) for I(engine_type=ACTIVEMQ).
+      - Set to C(latest) to select the most recent available version on creation.
+    type: str
+  host_instance_type:
+    description:
+      - The broker's instance type.
+    type: str
+  enable_audit_log:
+    description:
+      - Enable audit logs. Only applicable for I(engine_type=ACTIVEMQ).
+    default: false
+    type: bool
+  enable_general_log:
+    description:
+      - Enable general logs.
+    default: false
+    type: bool
+  security_groups:
+    description:
+      - The list of security group IDs assigned to the broker.
+    type: list
+    elements: str
+  wait:
+    description:
+      - Wait for the broker to reach its target state before returning.
+    default: false
+    type: bool
+  wait_timeout:
+    description:
+      - How long to wait (in seconds) for the broker to reach its target state.
+      - Only applicable if I(wait=true).
+    default: 900
+    type: int
+extends_documentation_fragment:
+- amazon.aws.aws
+- amazon.aws.ec2
+
+'''
+
+EXAMPLES = r'''
+# Note: These examples do not set authentication details, see the AWS Guide for details.
+
+- name: Create a broker and wait until it is running
+  community.aws.mq_broker:
+    broker_name: my_broker
+    security_groups:
+      - sg_xxxxxxx
+    subnet_ids:
+      - subnet_xxx
+    wait: true
+    wait_timeout: 1800
+
+- name: Reboot a broker
+  community.aws.mq_broker:
+    broker_name: my_broker
+    state: restarted
+    wait: true
+
+- name: Delete a broker
+  community.aws.mq_broker:
+    broker_name: my_broker
+    state: absent
+    wait: true
+'''
+
+RETURN = r'''
+broker:
+    description:
+      - The API response of the final describe_broker call, or a shortened version of
+        it for deleted brokers and in check mode.
+    returned: success
+    type: dict
+    sample: { "broker_id": "b-4d9b4b94-xxxx-xxxx-xxxx-f1b42bf43a0f", "broker_name": "my_broker" }
+'''
+
+import copy
+
+try:
+    import botocore
+except ImportError:
+    pass  # handled by AnsibleAWSModule
+
+from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+
+from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
+from ansible_collections.amazon.aws.plugins.module_utils.core import is_boto3_error_code
+
+from ansible_collections.community.aws.plugins.module_utils.mq import api_call
+from ansible_collections.community.aws.plugins.module_utils.mq import get_broker_id
+from ansible_collections.community.aws.plugins.module_utils.mq import get_broker_info
+from ansible_collections.community.aws.plugins.module_utils.mq import get_mq_client
+
+
+CREATE_ONLY_PARAMS = frozenset((
+    'deployment_mode',
+    'use_aws_owned_key',
+    'kms_key_id',
+    'engine_type',
+    'maintenance_window_start_time',
+    'publicly_accessible',
+    'storage_type',
+    'subnet_ids',
+    'users',
+    'tags',
+))
+
+PARAMS_MAP = {
+    'authentication_strategy': 'AuthenticationStrategy',
+    'auto_minor_version_upgrade': 'AutoMinorVersionUpgrade',
+    'broker_name': 'BrokerName',
+    'deployment_mode': 'DeploymentMode',
+    'use_aws_owned_key': 'EncryptionOptions/UseAwsOwnedKey',
+    'kms_key_id': 'EncryptionOptions/KmsKeyId',
+    'engine_type': 'EngineType',
+    'engine_version': 'EngineVersion',
+    'host_instance_type': 'HostInstanceType',
+    'enable_audit_log': 'Logs/Audit',
+    'enable_general_log': 'Logs/General',
+    'maintenance_window_start_time': 'MaintenanceWindowStartTime',
+    'publicly_accessible': 'PubliclyAccessible',
+    'security_groups': 'SecurityGroups',
+    'storage_type': 'StorageType',
+    'subnet_ids': 'SubnetIds',
+    'users': 'Users',
+    'tags': 'Tags',
+}
+
+DEFAULTS = {
+    'authentication_strategy': 'SIMPLE',
+    'auto_minor_version_upgrade': True,
+    'engine_type': 'ACTIVEMQ',
+    'engine_version': 'latest',
+    'host_instance_type': 'mq.t3.micro',
+    'enable_audit_log': False,
+    'enable_general_log': False,
+    'publicly_accessible': False,
+    'storage_type': 'EFS',
+}
+
+# precompiled at import time: module parameter -> tuple of nested API keys
+_PARAMS_PATHS = dict((key, tuple(path.split('/'))) for key, path in PARAMS_MAP.items())
+
+WAITER_DELAY_SEC = 15
+
+
+def _set_kwarg(kwargs, key, value):
+    path = _PARAMS_PATHS[key]
+    data = kwargs
+    for path_key in path[:-1]:
+        data = data.setdefault(path_key, {})
+    data[path[-1]] = value
+
+
+def _fill_kwargs(module, apply_defaults=True, ignore_create_params=False):
+    # silently skip CREATE_ONLY_PARAMS on update to make playbooks idempotent
+    create_skip = CREATE_ONLY_PARAMS if ignore_create_params else frozenset()
+    kwargs = {}
+    if apply_defaults:
+        for p_name, p_value in DEFAULTS.items():
+            _set_kwarg(kwargs, p_name, p_value)
+    for p_name, p_value in module.params.items():
+        if p_value is None or p_name not in _PARAMS_PATHS or p_name in create_skip:
+            continue
+        _set_kwarg(kwargs, p_name, p_value)
+    return kwargs
+
+
+def _get_waiter(conn, waiter_name, wait_timeout):
+    """Return a custom waiter: botocore ships no waiter definitions for the mq service."""
+    # deferred: botocore.waiter is not pulled in by boto3 client setup and is
+    # only needed when the caller asked to wait
+    import botocore.waiter
+
+    max_attempts = max(wait_timeout // WAITER_DELAY_SEC, 1)
+    model = botocore.waiter.WaiterModel({
+        'version': 2,
+        'waiters': {
+            'BrokerAvailable': {
+                'operation': 'DescribeBroker',
+                'delay': WAITER_DELAY_SEC,
+                'maxAttempts': max_attempts,
+                'acceptors': [
+                    {'matcher': 'path', 'argument': 'BrokerState', 'expected': 'RUNNING', 'state': 'success'},
+                    {'matcher': 'path', 'argument': 'BrokerState', 'expected': 'CREATION_FAILED', 'state': 'failure'},
+                    {'matcher': 'path', 'argument': 'BrokerState', 'expected': 'DELETION_IN_PROGRESS', 'state': 'failure'},
+                ],
+            },
+            'BrokerDeleted': {
+                'operation': 'DescribeBroker',
+                'delay': WAITER_DELAY_SEC,
+                'maxAttempts': max_attempts,
+                'acceptors': [
+                    {'matcher': 'error', 'expected': 'NotFoundException', 'state': 'success'},
+                    {'matcher': 'path', 'argument': 'BrokerState', 'expected': 'DELETION_IN_PROGRESS', 'state': 'retry'},
+                ],
+            },
+            'BrokerRebooted': {
+                'operation': 'DescribeBroker',
+                'delay': WAITER_DELAY_SEC,
+                'maxAttempts': max_attempts,
+                'acceptors': [
+                    {'matcher': 'path', 'argument': 'BrokerState', 'expected': 'RUNNING', 'state': 'success'},
+                ],
+            },
+        },
+    })
+    return botocore.waiter.create_waiter_with_client(waiter_name, model, conn)
+
+
+def wait_for_broker(conn, module, broker_id, waiter_name):
+    try:
+        waiter = _get_waiter(conn, waiter_name, module.params['wait_timeout'])
+        waiter.wait(BrokerId=broker_id)
+    except botocore.exceptions.WaiterError as e:
+        module.fail_json_aws(e, msg="Broker {0} did not reach the expected state.".format(broker_id))
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't wait for broker {0}.".format(broker_id))
+
+
+@api_call("Couldn't list engine versions.")
+def get_latest_engine_version(conn, module, engine_type):
+    response = conn.describe_broker_engine_types(EngineType=engine_type, aws_retry=True)
+    return response['BrokerEngineTypes'][0]['EngineVersions'][0]['Name']
+
+
+@api_call("Couldn't reboot broker.")
+def reboot_broker(conn, module, broker_id):
+    return conn.reboot_broker(BrokerId=broker_id, aws_retry=True)
+
+
+@api_call("Couldn't delete broker.")
+def delete_broker(conn, module, broker_id):
+    return conn.delete_broker(BrokerId=broker_id, aws_retry=True)
+
+
+# a broker cannot be created without users; applied when the caller supplies none
+_DEFAULT_USERS = [{
+    'Username': 'admin',
+    'Password': 'adminPassword',
+    'ConsoleAccess': True,
+    'Groups': [],
+}]
+
+# create-time validation pipeline, built once at import: (predicate, failure message)
+_CREATE_VALIDATORS = (
+    (lambda kwargs: kwargs.get('AuthenticationStrategy') == 'LDAP',
+     "'ldap' authentication strategy is currently not supported by the module."),
+    (lambda kwargs: not kwargs.get('SecurityGroups'),
+     "At least one security group must be specified on broker creation."),
+)
+
+
+def create_broker(conn, module):
+    kwargs = _fill_kwargs(module)
+    if kwargs['EngineVersion'] == 'latest':
+        kwargs['EngineVersion'] = get_latest_engine_version(conn, module, kwargs['EngineType'])
+    for is_invalid, error_msg in _CREATE_VALIDATORS:
+        if is_invalid(kwargs):
+            module.fail_json(msg=error_msg)
+    if 'Users' not in kwargs:
+        kwargs['Users'] = copy.deepcopy(_DEFAULT_USERS)
+    try:
+        result = conn.create_broker(aws_retry=True, **kwargs)
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't create broker.")
+    return {'broker': camel_dict_to_snake_dict(result, ignore_list=['Tags']), 'changed': True}
+
+
+def _values_match(current_value, desired_value):
+    if isinstance(desired_value, dict) and isinstance(current_value, dict):
+        # describe_broker returns read-only extras in nested objects (e.g. the
+        # log group names in Logs) - only compare the keys we want to set
+        return all(_values_match(current_value.get(key), value) for key, value in desired_value.items())
+    if isinstance(desired_value, list) and isinstance(current_value, list):
+        try:
+            return sorted(current_value) == sorted(desired_value)
+        except TypeError:
+            return current_value == desired_value
+    return current_value == desired_value
+
+
+def _broker_update_diff(current, desired):
+    """Return the subset of desired kwargs that differs from the current broker state."""
+    diff = {}
+    for key, value in desired.items():
+        if not _values_match(current.get(key), value):
+            diff[key] = value
+    return diff
+
+
+def update_broker(conn, module, broker_id):
+    kwargs = _fill_kwargs(module, apply_defaults=False, ignore_create_params=True)
+    # replace name with id
+    del kwargs['BrokerName']
+    current = get_broker_info(conn, module, broker_id)
+    kwargs = _broker_update_diff(current, kwargs)
+    if not kwargs:
+        # nothing to change - skip the update_broker call entirely
+        return {'broker': camel_dict_to_snake_dict(current, ignore_list=['Tags']), 'changed': False}
+    kwargs['BrokerId'] = broker_id
+    try:
+        result = conn.update_broker(aws_retry=True, **kwargs)
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't update broker.")
+    return {'broker': camel_dict_to_snake_dict(result, ignore_list=['Tags']), 'changed': True}
+
+
+def ensure_present(conn, module):
+    if module.check_mode:
+        return {'broker': {'broker_name': module.params['broker_name'], 'broker_id': None}, 'changed': True}
+    broker_id = get_broker_id(conn, module)
+    if broker_id:
+        result = update_broker(conn, module, broker_id)
+    else:
+        result = create_broker(conn, module)
+        broker_id = result['broker']['broker_id']
+    if module.params['wait']:
+        wait_for_broker(conn, module, broker_id, 'BrokerAvailable')
+    elif not result['changed']:
+        # the no-op update path already returned a full describe_broker payload
+        return result
+    api_result = get_broker_info(conn, module, broker_id)
+    result['broker'] = camel_dict_to_snake_dict(api_result, ignore_list=['Tags'])
+    return result
+
+
+def ensure_absent(conn, module):
+    result = {'broker_name': module.params['broker_name'], 'broker_id': None}
+    if module.check_mode:
+        return {'broker': result, 'changed': True}
+    broker_id = get_broker_id(conn, module)
+    result['broker_id'] = broker_id
+    if not broker_id:
+        # silently ignore delete of unknown broker (to make it idempotent)
+        return {'broker': result, 'changed': False}
+    # optimistic describe: the indexed id may be stale if the broker is already gone
+    try:
+        api_result = conn.describe_broker(BrokerId=broker_id, aws_retry=True)
+    except is_boto3_error_code('NotFoundException'):
+        return {'broker': result, 'changed': False}
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:  # pylint: disable=duplicate-except
+        module.fail_json_aws(e, msg="Couldn't get broker details.")
+    if api_result['BrokerState'] == 'DELETION_IN_PROGRESS':
+        if module.params['wait']:
+            wait_for_broker(conn, module, broker_id, 'BrokerDeleted')
+        return {'broker': result, 'changed': False}
+    delete_broker(conn, module, broker_id)
+    if module.params['wait']:
+        wait_for_broker(conn, module, broker_id, 'BrokerDeleted')
+    return {'broker': result, 'changed': True}
+
+
+def ensure_restarted(conn, module):
+    broker_id = get_broker_id(conn, module)
+    if not broker_id:
+        module.fail_json(msg="Cannot find broker with name {0}.".format(module.params['broker_name']))
+    if module.check_mode:
+        return {'broker': {'broker_name': module.params['broker_name'], 'broker_id': broker_id}, 'changed': True}
+    reboot_broker(conn, module, broker_id)
+    if module.params['wait']:
+        wait_for_broker(conn, module, broker_id, 'BrokerRebooted')
+    api_result = get_broker_info(conn, module, broker_id)
+    return {'broker': camel_dict_to_snake_dict(api_result, ignore_list=['Tags']), 'changed': True}
+
+
+def main():
+    argument_spec = dict(
+        broker_name=dict(required=True, type='str'),
+        state=dict(default='present', choices=['present', 'absent', 'restarted']),
+        # parameters only allowed on create
+        deployment_mode=dict(choices=['SINGLE_INSTANCE', 'ACTIVE_STANDBY_MULTI_AZ', 'CLUSTER_MULTI_AZ']),
+        use_aws_owned_key=dict(type='bool'),
+        kms_key_id=dict(type='str'),
+        engine_type=dict(choices=['ACTIVEMQ', 'RABBITMQ'], type='str'),
+        maintenance_window_start_time=dict(type='dict'),
+        publicly_accessible=dict(type='bool'),
+        storage_type=dict(choices=['EBS', 'EFS']),
+        subnet_ids=dict(type='list', elements='str'),
+        users=dict(type='list', elements='dict'),
+        tags=dict(type='dict'),
+        # parameters allowed on update as well
+        authentication_strategy=dict(choices=['SIMPLE', 'LDAP']),
+        auto_minor_version_upgrade=dict(default=True, type='bool'),
+        engine_version=dict(type='str'),
+        host_instance_type=dict(type='str'),
+        enable_audit_log=dict(default=False, type='bool'),
+        enable_general_log=dict(default=False, type='bool'),
+        security_groups=dict(type='list', elements='str'),
+        wait=dict(default=False, type='bool'),
+        wait_timeout=dict(default=900, type='int'),
+    )
+
+    module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    connection = get_mq_client(module)
+
+    state = module.params['state']
+    if state == 'present':
+        result = ensure_present(connection, module)
+    elif state == 'absent':
+        result = ensure_absent(connection, module)
+    elif state == 'restarted':
+        result = ensure_restarted(connection, module)
+
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
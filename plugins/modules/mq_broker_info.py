@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: mq_broker_info
+version_added: 1.4.0
+short_description: Retrieve Amazon MQ broker details
+description:
+  - Get details about an Amazon MQ broker, referenced either by its id or by its name.
+requirements: [ boto3 ]
+author: "FCO (@fotto)"
+options:
+  broker_id:
+    description:
+      - Get details for the broker with the given id.
+      - Exactly one of I(broker_id) and I(broker_name) is required.
+    type: str
+  broker_name:
+    description:
+      - Get details for the broker with the given name.
+      - Exactly one of I(broker_id) and I(broker_name) is required.
+    type: str
+extends_documentation_fragment:
+- amazon.aws.aws
+- amazon.aws.ec2
+
+'''
+
+EXAMPLES = r'''
+# Note: These examples do not set authentication details, see the AWS Guide for details.
+
+- name: Get broker details by id
+  community.aws.mq_broker_info:
+    broker_id: "b-4d9b4b94-xxxx-xxxx-xxxx-f1b42bf43a0f"
+  register: result
+
+- name: Get broker details by name
+  community.aws.mq_broker_info:
+    broker_name: my_broker
+  register: result
+'''
+
+RETURN = r'''
+broker:
+    description: The API response of describe_broker converted to snake case.
+    returned: success
+    type: dict
+    sample: { "broker_id": "b-4d9b4b94-xxxx-xxxx-xxxx-f1b42bf43a0f", "broker_name": "my_broker" }
+'''
+
+import re
+
+from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+
+from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
+
+from ansible_collections.community.aws.plugins.module_utils.mq import get_broker_id
+from ansible_collections.community.aws.plugins.module_utils.mq import get_broker_info
+from ansible_collections.community.aws.plugins.module_utils.mq import get_mq_client
+
+
+# broker ids have a fixed shape ("b-" plus a UUID); a broker_name matching it
+# can be used with describe_broker directly, without a list_brokers scan
+BROKER_ID_PATTERN = re.compile(r'^b-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+
+def main():
+    argument_spec = dict(
+        broker_id=dict(type='str'),
+        broker_name=dict(type='str'),
+    )
+
+    module = AnsibleAWSModule(
+        argument_spec=argument_spec,
+        required_one_of=[['broker_id', 'broker_name']],
+        mutually_exclusive=[['broker_id', 'broker_name']],
+        supports_check_mode=True,
+    )
+
+    connection = get_mq_client(module)
+
+    # never call list_brokers if the caller supplied the broker id,
+    # or a broker name that already has the shape of an id
+    broker_id = module.params['broker_id']
+    if not broker_id and BROKER_ID_PATTERN.match(module.params['broker_name']):
+        broker_id = module.params['broker_name']
+    if not broker_id:
+        broker_id = get_broker_id(connection, module)
+    if not broker_id:
+        module.fail_json(msg="Cannot find broker with name {0}.".format(module.params['broker_name']))
+
+    result = get_broker_info(connection, module, broker_id)
+    module.exit_json(broker=camel_dict_to_snake_dict(result, ignore_list=['Tags']))
+
+
+if __name__ == '__main__':
+    main()
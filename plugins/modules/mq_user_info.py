@@ -0,0 +1,153 @@
+#!/usr/bin/python
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: mq_user_info
+version_added: 1.4.0
+short_description: List users of an Amazon MQ broker
+description:
+  - List the users of an Amazon MQ broker, optionally skipping users that are
+    pending creation or deletion.
+requirements: [ boto3 ]
+author: "FCO (@fotto)"
+options:
+  broker_id:
+    description:
+      - The id of the broker to list users for.
+    required: true
+    type: str
+  max_results:
+    description:
+      - The maximum number of users fetched per C(list_users) API page.
+    default: 100
+    type: int
+  skip_pending_create:
+    description:
+      - Skip users that are pending creation and have never been active.
+    default: false
+    type: bool
+  skip_pending_delete:
+    description:
+      - Skip users that are pending deletion.
+    default: false
+    type: bool
+  as_dict:
+    description:
+      - Return the users as a dict keyed by username instead of a list.
+    default: true
+    type: bool
+extends_documentation_fragment:
+- amazon.aws.aws
+- amazon.aws.ec2
+
+'''
+
+EXAMPLES = r'''
+# Note: These examples do not set authentication details, see the AWS Guide for details.
+
+- name: List all users of a broker as a dict
+  community.aws.mq_user_info:
+    broker_id: "b-4d9b4b94-xxxx-xxxx-xxxx-f1b42bf43a0f"
+  register: result
+
+- name: List only active users as a list
+  community.aws.mq_user_info:
+    broker_id: "b-4d9b4b94-xxxx-xxxx-xxxx-f1b42bf43a0f"
+    as_dict: false
+    skip_pending_create: true
+    skip_pending_delete: true
+  register: result
+'''
+
+RETURN = r'''
+users:
+    description: The broker users, as a list or as a dict keyed by username depending on I(as_dict).
+    returned: success
+    type: dict
+    sample: { "admin": { "Username": "admin", "GroupsPendingChange": [], "PendingChange": "CREATE" } }
+'''
+
+try:
+    import botocore
+except ImportError:
+    pass  # handled by AnsibleAWSModule
+
+from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
+
+from ansible_collections.community.aws.plugins.module_utils.mq import get_mq_client
+
+
+DEFAULTS = {
+    'max_results': 100,
+    'skip_pending_create': False,
+    'skip_pending_delete': False,
+    'as_dict': True,
+}
+
+
+def get_user_records(conn, module):
+    try:
+        records = []
+        add_records = records.extend
+        paginator = conn.get_paginator('list_users')
+        pages = paginator.paginate(
+            BrokerId=module.params['broker_id'],
+            PaginationConfig={'PageSize': module.params['max_results']},
+        )
+        for page in pages:
+            add_records(page['Users'])
+        return records
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't list users.")
+
+
+def get_user_info(conn, module):
+    response_records = get_user_records(conn, module)
+    skip_states = set()
+    if module.params['skip_pending_create']:
+        skip_states.add('CREATE')
+    if module.params['skip_pending_delete']:
+        skip_states.add('DELETE')
+    as_dict = module.params['as_dict']
+    if not skip_states:
+        # nothing to filter - index the records or return them untouched
+        if as_dict:
+            return {record['Username']: record for record in response_records}
+        return response_records
+    # filter and index the records in a single comprehension pass
+    user_records = {
+        record['Username']: record
+        for record in response_records
+        if record.get('PendingChange') not in skip_states
+    }
+    if as_dict:
+        return user_records
+    return list(user_records.values())
+
+
+def main():
+    argument_spec = dict(
+        broker_id=dict(required=True, type='str'),
+        max_results=dict(default=DEFAULTS['max_results'], type='int'),
+        skip_pending_create=dict(default=DEFAULTS['skip_pending_create'], type='bool'),
+        skip_pending_delete=dict(default=DEFAULTS['skip_pending_delete'], type='bool'),
+        as_dict=dict(default=DEFAULTS['as_dict'], type='bool'),
+    )
+
+    module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    connection = get_mq_client(module)
+
+    result = get_user_info(connection, module)
+
+    module.exit_json(users=result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.amazon.aws.plugins.module_utils.ec2 import HAS_BOTO3
+from ansible_collections.community.aws.tests.unit.compat.mock import MagicMock
+
+from ansible_collections.community.aws.plugins.module_utils import mq
+from ansible_collections.community.aws.plugins.modules import mq_broker
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("mq_broker.py requires the `boto3` and `botocore` modules")
+
+
+def _fake_module(params):
+    module = MagicMock()
+    module.params = params
+    return module
+
+
+class TestFillKwargs:
+    def test_simple_mapping(self):
+        module = _fake_module({
+            'broker_name': 'test_broker',
+            'host_instance_type': 'mq.t3.micro',
+        })
+        kwargs = mq_broker._fill_kwargs(module, apply_defaults=False)
+        assert kwargs == {'BrokerName': 'test_broker', 'HostInstanceType': 'mq.t3.micro'}
+
+    def test_nested_mapping(self):
+        module = _fake_module({
+            'broker_name': 'test_broker',
+            'use_aws_owned_key': False,
+            'kms_key_id': 'my_key_id',
+            'enable_audit_log': True,
+        })
+        kwargs = mq_broker._fill_kwargs(module, apply_defaults=False)
+        assert kwargs['EncryptionOptions'] == {'UseAwsOwnedKey': False, 'KmsKeyId': 'my_key_id'}
+        assert kwargs['Logs'] == {'Audit': True}
+
+    def test_defaults_overridden_by_params(self):
+        module = _fake_module({
+            'broker_name': 'test_broker',
+            'host_instance_type': 'mq.m5.large',
+        })
+        kwargs = mq_broker._fill_kwargs(module)
+        assert kwargs['HostInstanceType'] == 'mq.m5.large'
+        assert kwargs['EngineType'] == 'ACTIVEMQ'
+
+    def test_create_only_params_ignored_on_update(self):
+        module = _fake_module({
+            'broker_name': 'test_broker',
+            'subnet_ids': ['subnet-xxx'],
+            'security_groups': ['sg-xxx'],
+        })
+        kwargs = mq_broker._fill_kwargs(module, apply_defaults=False, ignore_create_params=True)
+        assert 'SubnetIds' not in kwargs
+        assert kwargs['SecurityGroups'] == ['sg-xxx']
+
+
+class TestBrokerUpdateDiff:
+    CURRENT = {
+        'BrokerId': 'b-a1',
+        'EngineVersion': '5.15.13',
+        'HostInstanceType': 'mq.t3.micro',
+        'Logs': {'Audit': False, 'General': True, 'GeneralLogGroup': '/aws/amazonmq/xxx'},
+        'SecurityGroups': ['sg-1', 'sg-2'],
+    }
+
+    def test_no_change(self):
+        desired = {
+            'EngineVersion': '5.15.13',
+            'Logs': {'General': True},
+            'SecurityGroups': ['sg-2', 'sg-1'],
+        }
+        assert mq_broker._broker_update_diff(self.CURRENT, desired) == {}
+
+    def test_only_changed_keys_returned(self):
+        desired = {
+            'EngineVersion': '5.15.13',
+            'HostInstanceType': 'mq.m5.large',
+            'Logs': {'Audit': True, 'General': True},
+        }
+        assert mq_broker._broker_update_diff(self.CURRENT, desired) == {
+            'HostInstanceType': 'mq.m5.large',
+            'Logs': {'Audit': True, 'General': True},
+        }
+
+
+class TestGetBrokerId:
+    BROKER_SUMMARIES = [
+        {'BrokerName': 'broker_a', 'BrokerId': 'b-a1'},
+        {'BrokerName': 'broker_b', 'BrokerId': 'b-b2'},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def clear_broker_index(self):
+        mq._BROKER_NAME_TO_ID.clear()
+
+    def _fake_conn(self):
+        conn = MagicMock()
+        conn.get_paginator.return_value.paginate.return_value = [
+            {'BrokerSummaries': self.BROKER_SUMMARIES[:1]},
+            {'BrokerSummaries': self.BROKER_SUMMARIES[1:]},
+        ]
+        return conn
+
+    def test_broker_found(self):
+        module = _fake_module({'broker_name': 'broker_b'})
+        assert mq.get_broker_id(self._fake_conn(), module) == 'b-b2'
+
+    def test_broker_not_found(self):
+        module = _fake_module({'broker_name': 'broker_c'})
+        assert mq.get_broker_id(self._fake_conn(), module) is None
@@ -0,0 +1,70 @@
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.amazon.aws.plugins.module_utils.ec2 import HAS_BOTO3
+from ansible_collections.community.aws.tests.unit.compat.mock import MagicMock
+
+from ansible_collections.community.aws.plugins.modules import mq_user_info
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("mq_user_info.py requires the `boto3` and `botocore` modules")
+
+
+USER_RECORDS = [
+    {'Username': 'active_user'},
+    {'Username': 'creating_user', 'PendingChange': 'CREATE'},
+    {'Username': 'deleting_user', 'PendingChange': 'DELETE'},
+]
+
+
+def _fake_module(**params):
+    module = MagicMock()
+    module.params = {
+        'broker_id': 'b-b2',
+        'max_results': 100,
+        'skip_pending_create': False,
+        'skip_pending_delete': False,
+        'as_dict': True,
+    }
+    module.params.update(params)
+    return module
+
+
+def _fake_conn(pages):
+    conn = MagicMock()
+    conn.get_paginator.return_value.paginate.return_value = pages
+    return conn
+
+
+class TestGetUserInfo:
+    def test_all_pages_fetched(self):
+        conn = _fake_conn([{'Users': USER_RECORDS[:2]}, {'Users': USER_RECORDS[2:]}])
+        result = mq_user_info.get_user_info(conn, _fake_module())
+        assert sorted(result) == ['active_user', 'creating_user', 'deleting_user']
+
+    def test_skip_pending(self):
+        conn = _fake_conn([{'Users': USER_RECORDS}])
+        module = _fake_module(skip_pending_create=True, skip_pending_delete=True)
+        result = mq_user_info.get_user_info(conn, module)
+        assert list(result) == ['active_user']
+
+    def test_as_list(self):
+        conn = _fake_conn([{'Users': USER_RECORDS}])
+        module = _fake_module(as_dict=False)
+        result = mq_user_info.get_user_info(conn, module)
+        assert result == USER_RECORDS
+
+    def test_as_list_with_filter(self):
+        conn = _fake_conn([{'Users': USER_RECORDS}])
+        module = _fake_module(as_dict=False, skip_pending_create=True)
+        result = mq_user_info.get_user_info(conn, module)
+        assert [r['Username'] for r in result] == ['active_user', 'deleting_user']
+
+    def test_skip_pending_delete_only(self):
+        conn = _fake_conn([{'Users': USER_RECORDS}])
+        module = _fake_module(skip_pending_delete=True)
+        result = mq_user_info.get_user_info(conn, module)
+        assert sorted(result) == ['active_user', 'creating_user']